@@ -16,13 +16,18 @@ import os
 import json
 import sys
 import argparse
+import cProfile
 import hashlib
+import pstats
 import random
+import re
 import time
+import tracemalloc
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import requests
 import google.generativeai as genai
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 def load_config():
     """설정 로드"""
@@ -146,7 +151,214 @@ def check_duplicate(title: str, content: str, history: List) -> bool:
     
     return False
 
-def get_quality_image_url(keyword: str) -> str:
+# 카테고리 분류 사전 (용어: 가중치) - 이미지/라벨 라우팅 공용
+# "ai"처럼 거의 모든 토픽에 등장하는 일반 용어는 가중치를 낮게 둔다
+# 영문 용어 끝의 "*"는 어간 표시 ("learn*"는 learning, learner도 매칭)
+CATEGORY_TERMS = {
+    "ai_tech": {
+        "ai": 0.5, "인공지능": 1.0, "artificial intelligence": 1.0, "기술": 1.0, "tech*": 1.0,
+        "로봇": 1.5, "robot*": 1.5, "자동화": 1.5, "자동": 1.0, "automat*": 1.5,
+        "머신러닝": 2.0, "딥러닝": 2.0, "machine learning": 2.0, "deep learning": 2.0,
+        "chatgpt": 1.5, "claude": 1.5, "gemini": 1.5, "perplexity": 1.5,
+        "api": 2.0, "코딩": 2.0, "coding": 2.0, "개발자": 1.5, "develop*": 1.5,
+        "플러그인": 1.5, "plugin*": 1.5, "데이터": 1.5, "data": 1.5,
+        "보안": 1.5, "secur*": 1.5, "프라이버시": 1.5, "privacy": 1.5,
+        "프롬프트": 1.5, "prompt*": 1.5, "벤치마크": 1.0, "트러블슈팅": 1.0
+    },
+    "learning": {
+        "학습": 1.5, "공부": 1.5, "교육": 1.5, "교육자": 2.0, "educat*": 1.5,
+        "study": 1.5, "studies": 1.5, "studying": 1.5, "student*": 2.0,
+        "learn*": 1.5, "tutorial*": 1.5, "beginner*": 1.5, "basic*": 1.0,
+        "course*": 1.5, "guide*": 1.0, "학생": 2.0, "입문": 1.5, "입문자": 2.0, "기초": 1.5,
+        "초보자": 1.5, "튜토리얼": 1.5, "가이드": 1.0, "로드맵": 1.0,
+        "연구원": 1.5, "q&a": 1.0, "마스터": 1.0, "핵심정리": 1.0
+    },
+    "workspace": {
+        "업무": 1.5, "직장": 1.5, "직장인": 2.0, "work*": 1.0, "office": 1.5,
+        "비즈니스": 2.0, "business*": 2.0, "마케팅": 2.0, "마케터": 2.0, "market*": 2.0,
+        "생산성": 2.0, "productiv*": 2.0, "협업": 2.0, "collaborat*": 2.0,
+        "창업자": 2.0, "스타트업": 2.0, "startup*": 2.0, "freelanc*": 1.5, "팀리더": 2.0,
+        "기획자": 1.5, "프레젠테이션": 2.0, "전략": 1.0, "실무": 1.0,
+        "비용 절감": 1.5, "시간 단축": 1.5, "효율": 1.0, "프리랜서": 1.5
+    },
+    "creative": {
+        "이미지": 2.0, "image*": 2.0, "음악": 2.0, "music*": 2.0, "영상": 2.0,
+        "video*": 2.0, "글쓰기": 2.0, "writ*": 1.5, "창작": 2.0, "창의": 1.5,
+        "creat*": 1.0, "midjourney": 2.0, "stable diffusion": 2.0,
+        "디자이너": 2.0, "design*": 1.5, "크리에이터": 2.0, "블로거": 1.5, "유튜버": 1.5,
+        "작가": 1.5, "번역": 1.0, "art": 1.0, "artist*": 1.5
+    }
+}
+
+# 카테고리별 기본 라벨 (모델 태그 앞에 붙는 정규화된 라벨)
+CATEGORY_LABELS = {
+    "ai_tech": ["AI", "인공지능"],
+    "learning": ["AI", "AI 교육"],
+    "workspace": ["AI", "업무 자동화"],
+    "creative": ["AI", "AI 창작"]
+}
+
+DEFAULT_CATEGORY = "creative"
+
+
+def _trie_pattern(node: Dict) -> str:
+    """접두사 트리를 정규식으로 변환 (공통 접두사 공유로 분기 최소화)"""
+    alternatives = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    # 종료 표시는 마지막 분기로 두어 긴 용어를 우선 매칭
+    if '' in node:
+        alternatives.append(node[''])
+    if len(alternatives) == 1 and '' not in node:
+        return alternatives[0]
+    return '(?:' + '|'.join(alternatives) + ')'
+
+
+def _compile_category_matcher(category_terms: Dict) -> tuple:
+    """모든 카테고리 용어를 하나의 정규식으로 컴파일 - (패턴, 용어 색인, 어간 집합) 반환"""
+    term_index = {}
+    stems = set()
+    for category, terms in category_terms.items():
+        for term, weight in terms.items():
+            term = term.lower()
+            if term.endswith('*'):
+                term = term[:-1]
+                stems.add(term)
+            term_index.setdefault(term, []).append((category, weight))
+
+    trie = {}
+    for term in term_index:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        # 영문 용어는 단어 경계 적용 ("ai"가 "email"에 걸리지 않도록), 어간은 뒤에 붙는 영문자 허용,
+        # 한글은 조사 허용
+        if term in stems:
+            node[''] = '[a-z]*'
+        elif term[-1].isascii() and term[-1].isalnum():
+            node[''] = r'(?![a-z0-9])'
+        else:
+            node[''] = ''
+
+    alternatives = []
+    for ch, child in sorted(trie.items()):
+        prefix = r'(?<![a-z0-9])' if ch.isascii() and ch.isalnum() else ''
+        alternatives.append(prefix + re.escape(ch) + _trie_pattern(child))
+
+    return re.compile('|'.join(alternatives)), term_index, stems
+
+
+_CATEGORY_PATTERN, _CATEGORY_TERM_INDEX, _CATEGORY_STEMS = _compile_category_matcher(CATEGORY_TERMS)
+
+
+def _lookup_category_term(matched: str) -> List[Tuple[str, float]]:
+    """매칭된 문자열의 (카테고리, 가중치) 목록 - 어간 매칭이면 가장 긴 어간으로 조회"""
+    if matched in _CATEGORY_TERM_INDEX:
+        return _CATEGORY_TERM_INDEX[matched]
+    for end in range(len(matched) - 1, 0, -1):
+        if matched[:end] in _CATEGORY_STEMS:
+            return _CATEGORY_TERM_INDEX[matched[:end]]
+    return []
+
+
+def classify_topic(topic: str, title: str = "") -> List[Tuple[str, float]]:
+    """토픽+제목 전체를 한 번에 스캔해 가중치 순 카테고리 목록 반환"""
+    scores = {}
+    text = f"{topic or ''} {title or ''}".lower()
+    for match in _CATEGORY_PATTERN.finditer(text):
+        for category, weight in _lookup_category_term(match.group(0)):
+            scores[category] = scores.get(category, 0.0) + weight
+
+    # 동점이면 CATEGORY_TERMS 선언 순서 유지
+    order = list(CATEGORY_TERMS)
+    return sorted(scores.items(), key=lambda item: (-item[1], order.index(item[0])))
+
+
+def primary_category(topic: str, title: str = "") -> str:
+    """가장 가중치가 높은 카테고리 (매칭 없으면 기본 카테고리)"""
+    categories = classify_topic(topic, title)
+    return categories[0][0] if categories else DEFAULT_CATEGORY
+
+
+def normalize_labels(tags: List, limit: int = 8) -> List[str]:
+    """모델 태그 정규화 - '#' 제거, 공백 정리, 대소문자 무시 중복 제거"""
+    labels = []
+    seen = set()
+    for tag in tags or []:
+        if not isinstance(tag, str):
+            continue
+        label = ' '.join(tag.replace('#', ' ').split())
+        if not label or label.lower() in seen:
+            continue
+        seen.add(label.lower())
+        labels.append(label)
+        if len(labels) >= limit:
+            break
+    return labels
+
+
+def select_labels(topic: str, content_data: Dict, limit: int = 8) -> List[str]:
+    """분류 결과 기반 라벨 + 정규화된 모델 태그"""
+    category_labels = []
+    for category, _ in classify_topic(topic, content_data.get('title', ''))[:2]:
+        category_labels.extend(CATEGORY_LABELS[category])
+    if not category_labels:
+        category_labels = list(CATEGORY_LABELS[DEFAULT_CATEGORY])
+    return normalize_labels(category_labels + list(content_data.get('tags') or []), limit)
+
+
+def benchmark_category_classifier(history: List, rounds: int = 200) -> Dict:
+    """분류기 마이크로 벤치마크 - 처리량과 히스토리 기준 카테고리 커버리지
+
+    커버리지는 기존 방식과 같은 기준(기본 카테고리가 아닌 주 카테고리 비율)으로 비교한다.
+    """
+    topics = [(post['topic'], post.get('title', '')) for post in history if (post.get('topic') or '').strip()]
+    if not topics:
+        print("⚠️ 벤치마크할 히스토리 토픽이 없습니다")
+        return {}
+
+    # 기존 방식: 토픽 첫 단어에 대한 any() 스캔
+    legacy_terms = [
+        ("ai_tech", ["ai", "인공지능", "기술", "tech", "로봇", "자동"]),
+        ("learning", ["학습", "공부", "교육", "study", "learn"]),
+        ("workspace", ["업무", "직장", "work", "office", "비즈니스"])
+    ]
+
+    def legacy_category(topic):
+        keyword_lower = ''.join(topic.split()[:1]).lower()
+        for category, terms in legacy_terms:
+            if any(term in keyword_lower for term in terms):
+                return category
+        return DEFAULT_CATEGORY
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for topic, title in topics:
+            classify_topic(topic, title)
+    elapsed = time.perf_counter() - start
+
+    legacy_matched = sum(1 for topic, _ in topics if legacy_category(topic) != DEFAULT_CATEGORY)
+    matched = 0
+    distribution = {}
+    for topic, title in topics:
+        category = primary_category(topic, title)
+        distribution[category] = distribution.get(category, 0) + 1
+        if category != DEFAULT_CATEGORY:
+            matched += 1
+
+    result = {
+        'topics': len(topics),
+        'topics_per_second': len(topics) * rounds / elapsed if elapsed else float('inf'),
+        'legacy_coverage': legacy_matched / len(topics),
+        'coverage': matched / len(topics),
+        'distribution': distribution
+    }
+
+    print(f"⏱️ 분류 처리량: {result['topics_per_second']:,.0f} topics/s ({len(topics)}개 x {rounds}회)")
+    print(f"📊 기본({DEFAULT_CATEGORY}) 외 분류율: 기존 {result['legacy_coverage']:.0%} → 개선 {result['coverage']:.0%}")
+    print(f"🗂️ 카테고리 분포: {distribution}")
+    print("ℹ️ 용어 사전이 히스토리 토픽 어휘를 참고해 구성되어 있어 분류율은 표본 내(in-sample) 수치입니다")
+    return result
+
+def get_quality_image_url(topic: str, title: str = "") -> str:
     """고품질 이미지 URL 생성 (Unsplash 직접 URL)"""
     # Unsplash 이미지 컬렉션 (직접 URL 사용)
     unsplash_collections = {
@@ -192,16 +404,8 @@ def get_quality_image_url(keyword: str) -> str:
         ]
     }
     
-    # 키워드에 따라 적절한 카테고리 선택
-    keyword_lower = keyword.lower()
-    if any(term in keyword_lower for term in ["ai", "인공지능", "기술", "tech", "로봇", "자동"]):
-        images = unsplash_collections["ai_tech"]
-    elif any(term in keyword_lower for term in ["학습", "공부", "교육", "study", "learn"]):
-        images = unsplash_collections["learning"]
-    elif any(term in keyword_lower for term in ["업무", "직장", "work", "office", "비즈니스"]):
-        images = unsplash_collections["workspace"]
-    else:
-        images = unsplash_collections["creative"]
+    # 토픽 전체와 제목으로 카테고리 선택
+    images = unsplash_collections[primary_category(topic, title)]
     
     # 랜덤 선택 + 고품질 파라미터
     selected_image = random.choice(images)
@@ -271,8 +475,7 @@ def generate_high_quality_content(topic: str) -> Dict:
         result = json.loads(content_text)
         
         # 이미지 추가
-        image_keyword = topic.split()[0] if topic else "AI"
-        result['image_url'] = get_quality_image_url(image_keyword)
+        result['image_url'] = get_quality_image_url(topic or "AI", result.get('title', ''))
         
         return result
         
@@ -285,7 +488,7 @@ def generate_high_quality_content(topic: str) -> Dict:
             "content": f"<p>이 주제에 대한 자세한 내용을 준비 중입니다.</p><p>AI 기술의 발전과 함께 우리의 일상도 빠르게 변화하고 있습니다.</p>",
             "tags": ["AI", "인공지능", "자동화"],
             "summary": "AI 기술을 활용한 실용적인 가이드",
-            "image_url": get_quality_image_url("AI")
+            "image_url": get_quality_image_url(topic or "AI")
         }
 
 def create_beautiful_html(content_data: Dict) -> str:
@@ -524,6 +727,259 @@ def post_to_blog(config, title, content, labels=None):
         print(f'❌ 포스팅 중 오류: {e}')
         return None
 
+class StageProfiler:
+    """파이프라인 단계별 cProfile + tracemalloc 프로파일러 (--profile 전용)
+
+    같은 단계가 여러 번 실행되면(배치) 호출 횟수, 시간, 메모리를 단계별로 누적한다.
+    회귀 판정은 CPU 시간과 피크 메모리로만 하며, 벽시계 시간은 네트워크 대기나
+    sleep이 포함되므로 요약에 참고용으로만 남긴다.
+    """
+
+    # 베이스라인 비교 지표와 지표별 최소 허용 여유 (작은 베이스라인의 잡음 흡수)
+    GATED_METRICS = {'mean_cpu_seconds': 0.05, 'peak_kb': 256.0}
+
+    def __init__(self, output_dir: str = 'profile_reports', baseline_path: str = 'profile_baseline.json',
+                 tolerance: float = 1.5, top_allocations: int = 20, enabled: bool = True):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.baseline_path = baseline_path
+        self.tolerance = tolerance
+        self.top_allocations = top_allocations
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """단계 하나를 cProfile과 tracemalloc 스냅샷으로 감싸기"""
+        if not self.enabled:
+            yield
+            return
+
+        record = self.stages.setdefault(name, {
+            'profile': cProfile.Profile(),
+            'calls': 0,
+            'total_seconds': 0.0,
+            'max_seconds': 0.0,
+            'cpu_seconds': 0.0,
+            'peak_bytes': 0,
+            'allocations': []
+        })
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        base_memory = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        record['profile'].enable()
+        try:
+            yield
+        finally:
+            record['profile'].disable()
+            cpu_elapsed = time.process_time() - cpu_start
+            elapsed = time.perf_counter() - start
+
+            peak = tracemalloc.get_traced_memory()[1] - base_memory
+            after = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+
+            record['calls'] += 1
+            record['total_seconds'] += elapsed
+            record['max_seconds'] = max(record['max_seconds'], elapsed)
+            record['cpu_seconds'] += cpu_elapsed
+            record['peak_bytes'] = max(record['peak_bytes'], peak)
+            record['allocations'].append(self._top_allocations(before, after))
+
+    def _top_allocations(self, before, after) -> List[str]:
+        """스냅샷 차이에서 할당량 상위 라인 추출"""
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<unknown>')
+        ]
+        diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+        return [str(stat) for stat in diff[:self.top_allocations]]
+
+    @staticmethod
+    def _frame_label(func) -> str:
+        filename, line, name = func
+        if filename == '~':
+            return name
+        return f"{os.path.basename(filename)}:{line}({name})"
+
+    @staticmethod
+    def _is_profiler_frame(func) -> bool:
+        """프로파일러 자체 프레임 (contextmanager 진입/종료, stage 제너레이터, Profiler.disable)"""
+        filename, line, name = func
+        if filename == '~':
+            return '_lsprof.Profiler' in name
+        stage_code = StageProfiler.stage.__wrapped__.__code__
+        return filename == contextmanager.__code__.co_filename or (
+            filename == stage_code.co_filename and line == stage_code.co_firstlineno
+        )
+
+    def _caller_paths(self, stats: Dict, func, active: frozenset, memo: Dict) -> Tuple[List[Tuple[tuple, float]], bool]:
+        """func까지 이르는 호출 경로와 경로별 비중 (호출 간선별 누적 시간 비율)
+
+        재귀 순환으로 잘린 결과인지 여부를 함께 반환하며, 잘린 결과는 호출 맥락에
+        따라 달라지므로 memo에 저장하지 않는다.
+        """
+        if func in memo:
+            return memo[func], False
+
+        callers = stats[func][4]
+        truncated = any(c in active for c in callers)
+        edges = {c: edge for c, edge in callers.items() if c in stats and c != func and c not in active}
+        total = sum(edge[3] for edge in edges.values())
+        paths = []
+        if total > 0:
+            for caller, edge in edges.items():
+                share = edge[3] / total
+                caller_paths, caller_truncated = self._caller_paths(stats, caller, active | {func}, memo)
+                truncated = truncated or caller_truncated
+                for path, fraction in caller_paths:
+                    # 아주 작은 경로는 잘라 경로 수 폭증 방지
+                    if share * fraction >= 1e-4:
+                        paths.append((path + (func,), share * fraction))
+        if not paths:
+            paths = [((func,), 1.0)]
+
+        if not truncated:
+            memo[func] = paths
+        return paths, truncated
+
+    def _collapsed_stacks(self, profile) -> List[str]:
+        """pstats 호출 그래프를 flamegraph용 collapsed-stack 형식으로 변환
+
+        cProfile은 전체 스택 대신 호출 간선(caller -> callee)별 시간만 기록하므로,
+        각 함수의 자체 시간을 간선별 자체 시간대로 호출자에게 나누고 그 위 경로는
+        간선별 누적 시간 비율로 다시 나눠 근사한다. 자기 재귀 등 간선으로 나눠지지
+        않는 나머지는 재귀가 아닌 호출자 경로에 같은 비율로 나눈다.
+        """
+        stats = pstats.Stats(profile).stats
+        memo = {}
+        stacks = {}
+
+        def add(paths, seconds, leaf=None):
+            for path, fraction in paths:
+                key = path + (leaf,) if leaf else path
+                stacks[key] = stacks.get(key, 0.0) + seconds * fraction
+
+        for func, (_, _, self_time, _, callers) in stats.items():
+            attributed = 0.0
+            for caller, edge in callers.items():
+                if caller not in stats or caller == func or edge[2] <= 0:
+                    continue
+                attributed += edge[2]
+                add(self._caller_paths(stats, caller, frozenset(), memo)[0], edge[2], func)
+
+            remainder = self_time - attributed
+            if remainder > 0:
+                add(self._caller_paths(stats, func, frozenset(), memo)[0], remainder)
+
+        lines = []
+        for stack, seconds in stacks.items():
+            micros = int(seconds * 1_000_000)
+            if micros > 0 and not any(self._is_profiler_frame(f) for f in stack):
+                lines.append(f"{';'.join(self._frame_label(f) for f in stack)} {micros}")
+        return sorted(lines)
+
+    def summary(self) -> Dict:
+        """단계별 측정값 요약 (베이스라인과 같은 형식)"""
+        return {
+            name: {
+                'calls': record['calls'],
+                'mean_seconds': round(record['total_seconds'] / record['calls'], 6),
+                'max_seconds': round(record['max_seconds'], 6),
+                'mean_cpu_seconds': round(record['cpu_seconds'] / record['calls'], 6),
+                'peak_kb': round(record['peak_bytes'] / 1024, 1)
+            }
+            for name, record in self.stages.items()
+        }
+
+    def write_reports(self):
+        """단계별 collapsed-stack, 상위 할당, 요약 리포트 저장"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        for name, record in self.stages.items():
+            with open(os.path.join(self.output_dir, f'{name}.collapsed'), 'w', encoding='utf-8') as f:
+                f.write('\n'.join(self._collapsed_stacks(record['profile'])) + '\n')
+
+            with open(os.path.join(self.output_dir, f'{name}.alloc.txt'), 'w', encoding='utf-8') as f:
+                for index, allocations in enumerate(record['allocations'], 1):
+                    f.write(f"# {name} 호출 {index}/{record['calls']}\n")
+                    f.write('\n'.join(allocations) + '\n\n')
+
+        with open(os.path.join(self.output_dir, 'summary.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+        print(f"📁 프로파일 리포트 저장: {self.output_dir}")
+
+    def check_baseline(self) -> List[str]:
+        """베이스라인 임계값 대비 느려지거나 메모리가 늘어난 단계 목록
+
+        베이스라인 파일이나 단계/지표 항목이 없어도 실패로 본다 (--update-profile-baseline으로 생성).
+        """
+        try:
+            with open(self.baseline_path, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            return [f"베이스라인 파일 없음: {self.baseline_path} (--update-profile-baseline으로 생성)"]
+
+        regressions = []
+        for name, measured in self.summary().items():
+            limits = baseline.get(name) or {}
+            for metric, min_delta in self.GATED_METRICS.items():
+                if metric not in limits:
+                    regressions.append(f"{name}.{metric}: 베이스라인 항목 없음 ({self.baseline_path})")
+                    continue
+                threshold = max(limits[metric] * self.tolerance, limits[metric] + min_delta)
+                if measured[metric] > threshold:
+                    regressions.append(
+                        f"{name}.{metric}: {measured[metric]} > {threshold:.6g} "
+                        f"(베이스라인 {limits[metric]}, x{self.tolerance} 또는 +{min_delta})"
+                    )
+        return regressions
+
+    def save_baseline(self):
+        """현재 측정값을 베이스라인으로 저장 (기존 단계 값은 덮어씀)"""
+        try:
+            with open(self.baseline_path, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            baseline = {}
+
+        for name, measured in self.summary().items():
+            baseline[name] = {metric: measured[metric] for metric in self.GATED_METRICS}
+
+        with open(self.baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"💾 프로파일 베이스라인 갱신: {self.baseline_path}")
+
+    def finish(self, update_baseline: bool = False) -> List[str]:
+        """리포트 저장 후 베이스라인 비교 - 회귀 목록 반환"""
+        if not self.enabled or not self.stages:
+            return []
+
+        self.write_reports()
+        print("=" * 60)
+        for name, measured in self.summary().items():
+            print(f"⏱️ {name}: {measured['calls']}회, CPU 평균 {measured['mean_cpu_seconds']:.3f}s, "
+                  f"벽시계 평균 {measured['mean_seconds']:.3f}s (최대 {measured['max_seconds']:.3f}s), "
+                  f"피크 {measured['peak_kb']:,.1f}KB")
+
+        if update_baseline:
+            self.save_baseline()
+            return []
+
+        regressions = self.check_baseline()
+        for regression in regressions:
+            print(f"❌ 프로파일 회귀: {regression}")
+        return regressions
+
 def should_post_today(history, max_posts_per_day=1):
     """오늘 포스팅 가능 여부 확인 - 하루 1회로 제한"""
     today = datetime.now().strftime('%Y-%m-%d')
@@ -540,13 +996,12 @@ def should_post_today(history, max_posts_per_day=1):
     
     return len(today_posts) < max_posts_per_day
 
-def main():
-    parser = argparse.ArgumentParser(description='Enhanced Blog Automation v2.0')
-    parser.add_argument('--topic', help='특정 주제로 포스팅')
-    parser.add_argument('--labels', help='포스트 라벨 (쉼표 구분)')
-    parser.add_argument('--auto', action='store_true', help='자동 모드')
-    
-    args = parser.parse_args()
+def run_automation(args, profiler: StageProfiler):
+    """블로그 자동화 파이프라인 실행 (각 단계는 profiler.stage로 감쌈)"""
+    if args.benchmark_categories:
+        with profiler.stage('classify'):
+            benchmark_category_classifier(load_post_history())
+        return
     
     print("🚀 개선된 블로그 자동화 시스템 v2.0 시작")
     print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -563,7 +1018,8 @@ def main():
     # 포스팅 히스토리 확인
     history = load_post_history()
     
-    if args.auto:
+    # 프로파일 모드는 발행하지 않으므로 하루 포스팅 한도와 무관
+    if args.auto and not profiler.enabled:
         if not should_post_today(history):
             print("⏸️ 오늘 포스팅 한도 달성 (1회), 건너뛰기")
             return
@@ -572,36 +1028,47 @@ def main():
     max_attempts = 5
     selected_topic = None
     
-    for attempt in range(max_attempts):
-        topic = args.topic if args.topic else generate_dynamic_topic()
-        print(f"\n📝 생성된 토픽 (시도 {attempt + 1}): {topic}")
+    with profiler.stage('topic'):
+        for attempt in range(max_attempts):
+            topic = args.topic if args.topic else generate_dynamic_topic()
+            print(f"\n📝 생성된 토픽 (시도 {attempt + 1}): {topic}")
+            
+            # 2. 중복 체크
+            if not check_duplicate(topic, "", history):
+                selected_topic = topic
+                break
+            else:
+                print("⚠️ 유사한 토픽이 최근에 포스팅됨. 새 토픽 생성...")
+                time.sleep(1)
         
-        # 2. 중복 체크
-        if not check_duplicate(topic, "", history):
-            selected_topic = topic
-            break
-        else:
-            print("⚠️ 유사한 토픽이 최근에 포스팅됨. 새 토픽 생성...")
-            time.sleep(1)
-    
-    if not selected_topic:
-        selected_topic = generate_dynamic_topic()
-        print(f"🔄 최종 토픽: {selected_topic}")
+        if not selected_topic:
+            selected_topic = generate_dynamic_topic()
+            print(f"🔄 최종 토픽: {selected_topic}")
     
     # 3. 고품질 콘텐츠 생성
     print("✍️ AI 고품질 콘텐츠 생성 중...")
-    content_data = generate_high_quality_content(selected_topic)
+    with profiler.stage('content'):
+        content_data = generate_high_quality_content(selected_topic)
     
     # 4. HTML 포맷팅
     print("🎨 프리미엄 HTML 템플릿 적용 중...")
-    html_content = create_beautiful_html(content_data)
+    with profiler.stage('html'):
+        html_content = create_beautiful_html(content_data)
     
     # 5. 라벨 처리
-    labels = []
-    if args.labels:
-        labels = [label.strip() for label in args.labels.split(',')]
-    else:
-        labels = content_data.get('tags', ['AI', '인공지능', '블로그'])
+    with profiler.stage('labels'):
+        labels = []
+        if args.labels:
+            labels = [label.strip() for label in args.labels.split(',')]
+        else:
+            labels = select_labels(selected_topic, content_data)
+    
+    # 프로파일 모드는 발행/히스토리 저장 없이 종료 (베이스라인 검사 실패가 발행된 포스트의 히스토리 커밋을 막지 않도록)
+    if profiler.enabled:
+        print("\n🧪 프로파일 모드: 블로그 포스팅과 히스토리 저장 생략")
+        print(f"📌 제목: {content_data['title']}")
+        print(f"🏷️ 태그: {', '.join(labels)}")
+        return
     
     # 6. 블로그 포스팅
     print("📝 블로그 포스팅 중...")
@@ -631,5 +1098,34 @@ def main():
         print("\n❌ 블로그 자동화 실패")
         sys.exit(1)
 
+def main():
+    parser = argparse.ArgumentParser(description='Enhanced Blog Automation v2.0')
+    parser.add_argument('--topic', help='특정 주제로 포스팅')
+    parser.add_argument('--labels', help='포스트 라벨 (쉼표 구분)')
+    parser.add_argument('--auto', action='store_true', help='자동 모드')
+    parser.add_argument('--benchmark-categories', action='store_true', help='카테고리 분류기 벤치마크 실행')
+    parser.add_argument('--profile', action='store_true', help='단계별 CPU/메모리 프로파일링 (포스팅 없이 실행)')
+    parser.add_argument('--profile-dir', default='profile_reports', help='프로파일 리포트 저장 경로')
+    parser.add_argument('--profile-baseline', default='profile_baseline.json', help='단계별 임계값 베이스라인 파일')
+    parser.add_argument('--profile-tolerance', type=float, default=1.5, help='베이스라인 대비 허용 배수')
+    parser.add_argument('--update-profile-baseline', action='store_true', help='현재 측정값으로 베이스라인 갱신 (--profile 포함)')
+    
+    args = parser.parse_args()
+    
+    # 베이스라인 갱신은 측정값이 있어야 하므로 프로파일링을 함께 켬
+    if args.update_profile_baseline:
+        args.profile = True
+    
+    profiler = StageProfiler(args.profile_dir, args.profile_baseline, args.profile_tolerance, enabled=args.profile)
+    try:
+        run_automation(args, profiler)
+    finally:
+        # 실패/조기 종료에도 측정된 단계까지는 리포트 저장
+        regressions = profiler.finish(update_baseline=args.update_profile_baseline)
+    
+    if regressions:
+        print(f"❌ 프로파일 베이스라인 검사 실패 {len(regressions)}건")
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file